@@ -9,13 +9,15 @@ Hardware button controller for UniFi Protect camera privacy zones.
 - LED feedback: Optional LED indicators for privacy status
 """
 
+import array
 import asyncio
 import json
+import logging
 import os
 import signal
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, List
 
@@ -26,8 +28,14 @@ except ImportError:
     print("Note: This only works on Raspberry Pi hardware")
     sys.exit(1)
 
+try:
+    import orjson  # Faster config parsing when available
+except ImportError:
+    orjson = None
+
 from colorama import init, Fore, Style
 from dotenv import load_dotenv
+from uiprotect.data import Camera
 
 # Import our existing UniFi Protect manager
 from unifi_camera_privacy import UniFiProtectManager, load_config
@@ -35,33 +43,116 @@ from unifi_camera_privacy import UniFiProtectManager, load_config
 # Initialize colorama
 init(autoreset=True)
 
+# Status prefixes shared by the startup/status messages
+_OK = Fore.GREEN + "✓ "
+_ERR = Fore.RED + "✗ "
+_WARN = Fore.YELLOW + "⚠ "
+
+# Per-press and polling messages go through logging so they cost nothing
+# unless enabled (LOG_LEVEL=DEBUG); startup output stays on print()
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before retrying a failed privacy auto-disable
+TIMEOUT_RETRY_DELAY = 30.0
+
+# How often changed privacy state is written to disk (seconds)
+STATE_WRITE_INTERVAL = 5.0
+
+# How often to ping UniFi Protect so the first button press doesn't pay for
+# a new TCP+TLS connection. Kept below the client's HTTP keep-alive timeout
+# (HTTP_KEEPALIVE_TIMEOUT in unifi_camera_privacy, 30s).
+KEEPALIVE_INTERVAL = 10.0
+
+# Polled buttons go through a shift-register debouncer: each sample is
+# shifted in and a press is reported once the last DEBOUNCE_SAMPLES
+# samples are all LOW. Buttons are sampled DEBOUNCE_SAMPLES times per
+# polling interval, so a press must be stable for one full interval.
+DEBOUNCE_SAMPLES = 8
+DEBOUNCE_MASK = (1 << DEBOUNCE_SAMPLES) - 1
+
+# Button pin -> controller, used by the shared interrupt callback
+PIN_TO_CONTROLLER: Dict[int, 'PrivacyButtonController'] = {}
+
+
+def _dispatch(channel: int):
+    """Route a GPIO edge interrupt to the controller that owns the pin."""
+    controller = PIN_TO_CONTROLLER.get(channel)
+    if controller:
+        controller.button_callback(channel)
+
+
+async def poll_buttons(controllers: List['PrivacyButtonController'], polling_interval: float,
+                       stop_event: asyncio.Event):
+    """Poll buttons that have no working interrupt until stop_event is set.
+    
+    Each button goes through the shift-register debouncer, sampled
+    DEBOUNCE_SAMPLES times per polling interval on a fixed cadence.
+    """
+    # Pins and debounce shift registers, kept as parallel arrays indexed by
+    # position in controllers. A button held at startup counts as already pressed.
+    pins = array.array('i', [c.button_pin for c in controllers])
+    debounce = array.array('B', [DEBOUNCE_MASK if GPIO.input(pin) else 0 for pin in pins])
+    sample_interval = polling_interval / DEBOUNCE_SAMPLES
+    
+    # Bind lookups used on every sample to locals
+    gpio_input = GPIO.input
+    mask = DEBOUNCE_MASK
+    monotonic = time.monotonic
+    next_tick = monotonic() + sample_interval
+    
+    while not stop_event.is_set():
+        for i, controller in enumerate(controllers):
+            try:
+                previous = debounce[i]
+                current = ((previous << 1) | gpio_input(pins[i])) & mask
+                debounce[i] = current
+                
+                # Press = the register just became all LOW
+                if previous and not current:
+                    logger.debug("Button detected via polling for %s", controller.camera_name)
+                    controller.queue_button_press()
+                
+            except Exception as e:
+                logger.error("Button polling error for %s: %s", controller.camera_name, e)
+        
+        # Sleep until the next fixed tick so the cadence doesn't drift
+        now = monotonic()
+        if next_tick < now:
+            next_tick = now  # Fell behind - resync rather than burst
+        sleep_for = next_tick - now
+        next_tick += sample_interval
+        await asyncio.sleep(sleep_for)
+
+
 def load_cameras_config(config_file: str = "cameras_config.json") -> Dict:
     """Load camera configuration from JSON file."""
     config_path = Path(config_file)
     
     if not config_path.exists():
-        print(f"{Fore.RED}✗ Camera config file not found: {config_file}")
+        print(f"{_ERR}Camera config file not found: {config_file}")
         print(f"{Fore.CYAN}Please create {config_file} with your camera definitions")
         sys.exit(1)
     
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        config = orjson.loads(data) if orjson else json.loads(data)
         
         if 'cameras' not in config:
             raise ValueError("Config file must contain 'cameras' array")
         
-        print(f"{Fore.GREEN}✓ Loaded camera config from {config_file}")
+        print(f"{_OK}Loaded camera config from {config_file}")
         enabled_cameras = [cam for cam in config['cameras'] if cam.get('enabled', True)]
+        config['_enabled_cameras'] = enabled_cameras  # Reused by the controller setup
         print(f"{Fore.CYAN}  Found {len(enabled_cameras)} enabled cameras")
         
         return config
     
     except json.JSONDecodeError as e:
-        print(f"{Fore.RED}✗ Invalid JSON in config file: {e}")
+        print(f"{_ERR}Invalid JSON in config file: {e}")
         sys.exit(1)
     except Exception as e:
-        print(f"{Fore.RED}✗ Failed to load config: {e}")
+        print(f"{_ERR}Failed to load config: {e}")
         sys.exit(1)
 
 class PrivacyButtonController:
@@ -85,17 +176,37 @@ class PrivacyButtonController:
         
         # State management
         self.privacy_enabled = False
-        self.privacy_start_time: Optional[datetime] = None
-        self.last_button_press = 0
-        self.debounce_time = 0.3  # 300ms debounce
+        self.privacy_start_time: Optional[datetime] = None  # Wall clock, for the state file
+        self.privacy_start_monotonic: Optional[float] = None  # For elapsed-time math
+        self.debounce_time = 0.3  # 300ms debounce (interrupt bouncetime)
         
-        # UniFi Protect manager
+        # UniFi Protect manager and the camera it resolved for us
         self.manager: Optional[UniFiProtectManager] = None
+        self.camera: Optional[Camera] = None
         
         # Control flags
         self.running = True
+        self.interrupt_enabled = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event = asyncio.Event()
+        self._timeout_handle: Optional[asyncio.TimerHandle] = None
+        self._timeout_task: Optional[asyncio.Task] = None
         self.state_file = Path(f"/opt/unifi-camera-privacy/privacy_state_{camera_name}.json")
         
+        # Presses from the interrupt and polling paths are coalesced here
+        # and handled one at a time by a single consumer task
+        self._press_event = asyncio.Event()
+        self._press_task: Optional[asyncio.Task] = None
+        
+        # Held while privacy is being changed, so a press and the
+        # auto-disable never update the camera at the same time
+        self._privacy_lock = asyncio.Lock()
+        
+        # State changes are written out in batches by a writer task
+        self._state_dirty = False
+        self._state_dir_ok = False
+        self._state_writer_task: Optional[asyncio.Task] = None
+        
         print(f"{Fore.CYAN}Privacy Button Controller initialized:")
         print(f"  Camera: {camera_name}")
         print(f"  Button Pin: GPIO {button_pin}")
@@ -103,92 +214,118 @@ class PrivacyButtonController:
         print(f"  Timeout: {timeout_minutes} minutes")
     
     def setup_gpio(self):
-        """Set up GPIO pins."""
-        # Disable GPIO warnings for cleaner output
-        GPIO.setwarnings(False)
-        
-        # Clean up any existing GPIO state
-        GPIO.cleanup()
+        """Set up this controller's GPIO pins.
         
+        Global GPIO state (warnings, cleanup of stale pins) is reset once by
+        the caller before any controller is set up.
+        """
         GPIO.setmode(GPIO.BCM)
         
         try:
             GPIO.setup(self.button_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            print(f"{Fore.GREEN}✓ Button GPIO {self.button_pin} setup successful")
+            print(f"{_OK}Button GPIO {self.button_pin} setup successful")
         except Exception as e:
-            print(f"{Fore.RED}✗ Failed to setup button GPIO {self.button_pin}: {e}")
+            print(f"{_ERR}Failed to setup button GPIO {self.button_pin}: {e}")
             raise
         
         if self.led_pin:
             try:
                 GPIO.setup(self.led_pin, GPIO.OUT)
                 GPIO.output(self.led_pin, GPIO.LOW)
-                print(f"{Fore.GREEN}✓ LED GPIO {self.led_pin} setup successful")
+                print(f"{_OK}LED GPIO {self.led_pin} setup successful")
             except Exception as e:
-                print(f"{Fore.YELLOW}⚠ LED GPIO {self.led_pin} setup failed: {e}")
+                print(f"{_WARN}LED GPIO {self.led_pin} setup failed: {e}")
                 self.led_pin = None  # Disable LED if it can't be set up
         
-        # Set up button interrupt
+        # Set up button interrupt - RPi.GPIO blocks in epoll on the pin's
+        # edge events, so no polling is needed while this is active. The
+        # callback runs on RPi.GPIO's thread, so remember our loop first.
+        self._loop = asyncio.get_running_loop()
+        PIN_TO_CONTROLLER[self.button_pin] = self
         try:
             GPIO.add_event_detect(self.button_pin, GPIO.FALLING, 
-                                 callback=self.button_callback, bouncetime=200)
-            print(f"{Fore.GREEN}✓ Button interrupt setup successful")
+                                 callback=_dispatch,
+                                 bouncetime=int(self.debounce_time * 1000))
+            self.interrupt_enabled = True
+            print(f"{_OK}Button interrupt setup successful")
         except Exception as e:
-            print(f"{Fore.RED}✗ Failed to setup button interrupt: {e}")
+            self.interrupt_enabled = False
+            print(f"{_ERR}Failed to setup button interrupt: {e}")
             print(f"{Fore.YELLOW}  Will use polling mode only")
             # Don't raise here - polling backup will work
         
-        print(f"{Fore.GREEN}✓ GPIO setup complete")
+        print(f"{_OK}GPIO setup complete")
         print(f"{Fore.CYAN}  Button: GPIO {self.button_pin} (falling edge detection)")
         print(f"{Fore.CYAN}  LED: GPIO {self.led_pin}" if self.led_pin else f"{Fore.YELLOW}  LED: Disabled")
     
     def button_callback(self, channel):
-        """Handle button press with debouncing."""
-        current_time = time.time()
+        """Handle a button press interrupt.
         
-        print(f"{Fore.CYAN}🔘 Button callback triggered on GPIO {channel}")
+        Called from the RPi.GPIO edge thread, so the async handler is handed
+        over to the controller's event loop instead of being created here.
+        Debouncing is done by RPi.GPIO's bouncetime.
+        """
+        logger.debug("Button callback triggered on GPIO %d", channel)
         
-        # Debounce check
-        if current_time - self.last_button_press < self.debounce_time:
-            print(f"{Fore.YELLOW}  ⏱️ Debounced (too soon)")
+        # Late edges can still arrive while the process is shutting down
+        if self._loop.is_closed():
             return
         
-        self.last_button_press = current_time
-        print(f"{Fore.GREEN}  ✓ Button press accepted")
+        # Wake the press handler on the event loop thread
+        self._loop.call_soon_threadsafe(self._press_event.set)
+        logger.debug("GPIO %d press queued", channel)
+    
+    def queue_button_press(self):
+        """Signal a button press from the event loop thread."""
+        self._press_event.set()
+    
+    def start_tasks(self):
+        """Start the button press handler and state writer tasks."""
+        if self._press_task is None:
+            self._press_task = asyncio.create_task(self._press_loop())
+        if self._state_writer_task is None:
+            self._state_writer_task = asyncio.create_task(self._state_writer())
+    
+    async def _press_loop(self):
+        """Handle button presses one at a time as they are signalled.
         
-        # Queue the async button handler
-        try:
-            asyncio.create_task(self.handle_button_press())
-            print(f"{Fore.CYAN}  📋 Async task queued")
-        except Exception as e:
-            print(f"{Fore.RED}  ✗ Failed to queue async task: {e}")
+        Edges that arrive while a toggle is running or within debounce_time
+        after it belong to the same press storm and are dropped, so mashing
+        the button produces exactly one toggle.
+        """
+        while True:
+            await self._press_event.wait()
+            self._press_event.clear()
+            await self.handle_button_press()
+            
+            await asyncio.sleep(self.debounce_time)
+            self._press_event.clear()
     
     async def handle_button_press(self):
         """Handle button press async operations."""
-        print(f"{Fore.BLUE}🔄 Processing button press...")
+        logger.debug("Processing button press for %s", self.camera_name)
         try:
-            if self.privacy_enabled:
-                # Privacy is on, turn it off
-                print(f"{Fore.CYAN}  Current state: Privacy ON, disabling...")
-                await self.disable_privacy()
-                print(f"{Fore.GREEN}🔘 Button pressed - Privacy DISABLED")
-            else:
-                # Privacy is off, turn it on
-                print(f"{Fore.CYAN}  Current state: Privacy OFF, enabling...")
-                await self.enable_privacy()
-                print(f"{Fore.YELLOW}🔘 Button pressed - Privacy ENABLED")
+            async with self._privacy_lock:
+                if self.privacy_enabled:
+                    # Privacy is on, turn it off
+                    logger.debug("Current state: privacy ON, disabling")
+                    await self.disable_privacy()
+                    logger.info("Button pressed - privacy DISABLED for %s", self.camera_name)
+                else:
+                    # Privacy is off, turn it on
+                    logger.debug("Current state: privacy OFF, enabling")
+                    await self.enable_privacy()
+                    logger.info("Button pressed - privacy ENABLED for %s", self.camera_name)
         
-        except Exception as e:
-            print(f"{Fore.RED}✗ Button press error: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Button press error for %s", self.camera_name)
     
     async def enable_privacy(self):
         """Enable privacy mode for the camera."""
         try:
-            camera = self.manager.get_camera_by_name(self.camera_name)
+            camera = self.camera
             if not camera:
-                print(f"{Fore.RED}✗ Camera '{self.camera_name}' not found")
+                print(f"{_ERR}Camera '{self.camera_name}' not found")
                 return False
             
             # Enable privacy
@@ -197,8 +334,10 @@ class PrivacyButtonController:
             if success:
                 self.privacy_enabled = True
                 self.privacy_start_time = datetime.now()
+                self.privacy_start_monotonic = time.monotonic()
                 self.update_led()
                 self.save_state()
+                self.schedule_timeout()
                 
                 print(f"{Fore.YELLOW}🔒 Privacy enabled for {self.camera_name}")
                 print(f"  Auto-disable in {self.timeout_minutes} minutes")
@@ -206,15 +345,15 @@ class PrivacyButtonController:
                 return True
         
         except Exception as e:
-            print(f"{Fore.RED}✗ Failed to enable privacy: {e}")
+            print(f"{_ERR}Failed to enable privacy: {e}")
             return False
     
     async def disable_privacy(self):
         """Disable privacy mode for the camera."""
         try:
-            camera = self.manager.get_camera_by_name(self.camera_name)
+            camera = self.camera
             if not camera:
-                print(f"{Fore.RED}✗ Camera '{self.camera_name}' not found")
+                print(f"{_ERR}Camera '{self.camera_name}' not found")
                 return False
             
             # Disable privacy
@@ -223,6 +362,8 @@ class PrivacyButtonController:
             if success:
                 self.privacy_enabled = False
                 self.privacy_start_time = None
+                self.privacy_start_monotonic = None
+                self.cancel_timeout()
                 self.update_led()
                 self.save_state()
                 
@@ -231,7 +372,7 @@ class PrivacyButtonController:
                 return True
         
         except Exception as e:
-            print(f"{Fore.RED}✗ Failed to disable privacy: {e}")
+            print(f"{_ERR}Failed to disable privacy: {e}")
             return False
     
     def update_led(self):
@@ -246,20 +387,52 @@ class PrivacyButtonController:
             # Privacy off - LED on
             GPIO.output(self.led_pin, GPIO.HIGH)
     
-    async def check_timeout(self):
-        """Check if privacy should be auto-disabled due to timeout."""
-        if not self.privacy_enabled or not self.privacy_start_time:
+    def schedule_timeout(self, delay: Optional[float] = None):
+        """Arm the auto-disable timer for the current privacy session."""
+        self.cancel_timeout()
+        
+        if not self.privacy_enabled or self.privacy_start_monotonic is None or self.timeout_minutes <= 0:
             return
         
-        elapsed = datetime.now() - self.privacy_start_time
-        timeout_delta = timedelta(minutes=self.timeout_minutes)
+        if delay is None:
+            elapsed = time.monotonic() - self.privacy_start_monotonic
+            delay = max(0.0, self.timeout_minutes * 60 - elapsed)
         
-        if elapsed >= timeout_delta:
+        loop = asyncio.get_running_loop()
+        self._timeout_handle = loop.call_later(delay, self._on_timeout)
+    
+    def cancel_timeout(self):
+        """Cancel a pending auto-disable timer."""
+        if self._timeout_handle:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
+    
+    def _on_timeout(self):
+        """Timer callback - start disabling privacy on the event loop."""
+        self._timeout_handle = None
+        self._timeout_task = asyncio.create_task(self.expire_privacy())
+    
+    async def expire_privacy(self):
+        """Auto-disable privacy once the timeout has been reached."""
+        async with self._privacy_lock:
+            # A press may have disabled privacy while we waited for the lock
+            if not self.privacy_enabled:
+                return
+            
             print(f"{Fore.CYAN}⏰ Privacy timeout reached ({self.timeout_minutes} minutes)")
-            await self.disable_privacy()
+            if not await self.disable_privacy():
+                print(f"{_WARN}Auto-disable failed, retrying in {TIMEOUT_RETRY_DELAY:.0f}s")
+                self.schedule_timeout(TIMEOUT_RETRY_DELAY)
     
     def save_state(self):
-        """Save current state to file for persistence."""
+        """Mark state as changed - the state writer persists it shortly."""
+        self._state_dirty = True
+    
+    def flush_state(self):
+        """Write state to file now if it changed since the last write."""
+        if not self._state_dirty:
+            return
+        
         state = {
             'privacy_enabled': self.privacy_enabled,
             'privacy_start_time': self.privacy_start_time.isoformat() if self.privacy_start_time else None,
@@ -267,12 +440,31 @@ class PrivacyButtonController:
         }
         
         try:
-            # Create directory if it doesn't exist
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            # Create directory if it doesn't exist (once per run)
+            if not self._state_dir_ok:
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                self._state_dir_ok = True
+            
+            # Write a sibling file and rename it over the old state, so a
+            # power cut never leaves a truncated state file behind
+            payload = json.dumps(state, separators=(',', ':')).encode()
+            tmp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.state_file)
+            self._state_dirty = False
         except Exception as e:
-            print(f"{Fore.YELLOW}⚠ Failed to save state: {e}")
+            print(f"{_WARN}Failed to save state: {e}")
+    
+    async def _state_writer(self):
+        """Periodically persist changed state."""
+        while True:
+            await asyncio.sleep(STATE_WRITE_INTERVAL)
+            self.flush_state()
     
     def load_state(self):
         """Load previous state from file."""
@@ -285,24 +477,27 @@ class PrivacyButtonController:
             
             self.privacy_enabled = state.get('privacy_enabled', False)
             
+            elapsed = 0.0
             if state.get('privacy_start_time'):
                 self.privacy_start_time = datetime.fromisoformat(state['privacy_start_time'])
+                # Wall clock is only trusted once, to carry the session across a restart
+                elapsed = (datetime.now() - self.privacy_start_time).total_seconds()
+                self.privacy_start_monotonic = time.monotonic() - elapsed
             
             print(f"{Fore.CYAN}📄 Loaded previous state:")
             print(f"  Privacy: {'ENABLED' if self.privacy_enabled else 'DISABLED'}")
             
             if self.privacy_enabled and self.privacy_start_time:
-                elapsed = datetime.now() - self.privacy_start_time
-                remaining = timedelta(minutes=self.timeout_minutes) - elapsed
+                remaining = self.timeout_minutes * 60 - elapsed
                 
-                if remaining.total_seconds() <= 0:
+                if remaining <= 0:
                     print(f"  Status: Timeout expired, will disable privacy")
                 else:
-                    mins = int(remaining.total_seconds() / 60)
+                    mins = int(remaining / 60)
                     print(f"  Auto-disable in: {mins} minutes")
             
         except Exception as e:
-            print(f"{Fore.YELLOW}⚠ Failed to load state: {e}")
+            print(f"{_WARN}Failed to load state: {e}")
     
     async def connect_unifi(self):
         """Connect to UniFi Protect."""
@@ -323,26 +518,43 @@ class PrivacyButtonController:
         # Verify camera exists
         camera = self.manager.get_camera_by_name(self.camera_name)
         if not camera:
-            print(f"{Fore.RED}✗ Camera '{self.camera_name}' not found!")
+            print(f"{_ERR}Camera '{self.camera_name}' not found!")
             print(f"{Fore.CYAN}Available cameras:")
             for cam_id, cam_name, _ in self.manager.list_cameras():
                 print(f"  - {cam_name}")
             return False
         
-        print(f"{Fore.GREEN}✓ Found camera: {camera.name}")
+        self.camera = camera
+        print(f"{_OK}Found camera: {camera.name}")
         return True
     
+    def stop(self):
+        """Ask the main loop to exit."""
+        self.running = False
+        self._stop_event.set()
+    
     def cleanup(self):
         """Clean up GPIO and save state."""
         print(f"\n{Fore.CYAN}Cleaning up...")
         
+        self.cancel_timeout()
+        for task in (self._press_task, self._state_writer_task, self._timeout_task):
+            if task:
+                task.cancel()
+        self._press_task = None
+        self._state_writer_task = None
+        self._timeout_task = None
+        
         if self.led_pin:
             GPIO.output(self.led_pin, GPIO.LOW)
         
-        GPIO.cleanup()
-        self.save_state()
+        # Only release our own pins - other controllers may still be using theirs
+        PIN_TO_CONTROLLER.pop(self.button_pin, None)
+        pins = [self.button_pin] + ([self.led_pin] if self.led_pin else [])
+        GPIO.cleanup(pins)
+        self.flush_state()
         
-        print(f"{Fore.GREEN}✓ Cleanup complete")
+        print(f"{_OK}Cleanup complete")
     
     async def run(self):
         """Main controller loop - primarily for standalone use."""
@@ -362,43 +574,38 @@ class PrivacyButtonController:
                 return False
         
         # Set up GPIO
+        GPIO.setwarnings(False)
+        GPIO.cleanup()
         self.setup_gpio()
+        self.start_tasks()
         
         # Update LED based on current state
         self.update_led()
         
+        # Resume the auto-disable timer for a restored privacy session
+        self.schedule_timeout()
+        
         print(f"\n{Fore.GREEN}🚀 Privacy Button Controller is running!")
         print(f"{Fore.CYAN}Press the button to toggle privacy for '{self.camera_name}'")
         print(f"{Fore.CYAN}Press Ctrl+C to stop")
         
         try:
             # Main loop
-            last_button_state = GPIO.input(self.button_pin)
-            button_press_time = 0
-            
-            while self.running:
-                # Check timeout
-                await self.check_timeout()
-                
-                # Also poll button state as backup (in case interrupt fails)
-                current_button_state = GPIO.input(self.button_pin)
-                
-                # Detect button press (HIGH to LOW transition)
-                if last_button_state == GPIO.HIGH and current_button_state == GPIO.LOW:
-                    current_time = time.time()
-                    if current_time - button_press_time > 0.5:  # 500ms debounce
-                        button_press_time = current_time
-                        print(f"{Fore.MAGENTA}🔘 Button detected via polling backup")
-                        await self.handle_button_press()
-                
-                last_button_state = current_button_state
-                await asyncio.sleep(0.1)  # Check every 100ms
-                
+            if self.interrupt_enabled:
+                # Button presses arrive via the interrupt callback and the
+                # timeout is a scheduled timer, so just wait for shutdown
+                await self._stop_event.wait()
+            else:
+                # Poll the button (interrupt setup failed) - stable for 100ms
+                await poll_buttons([self], 0.1, self._stop_event)
+        
         except KeyboardInterrupt:
             print(f"\n{Fore.YELLOW}Received stop signal")
         
         finally:
             self.cleanup()
+            if self.manager:
+                await self.manager.disconnect()
         
         return True
 
@@ -413,6 +620,9 @@ class MultiCameraPrivacyController:
         self.manager: Optional[UniFiProtectManager] = None
         self.global_settings = config.get('global_settings', {})
         self.running = True
+        self._stop_event = asyncio.Event()
+        self._keepalive_handle: Optional[asyncio.TimerHandle] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
         
         print(f"{Fore.CYAN}{Style.BRIGHT}Multi-Camera Privacy Controller")
         print("=" * 50)
@@ -433,20 +643,23 @@ class MultiCameraPrivacyController:
         
         success = await self.manager.connect()
         if not success:
-            print(f"{Fore.RED}✗ Failed to connect to UniFi Protect")
+            print(f"{_ERR}Failed to connect to UniFi Protect")
             return False
         
-        print(f"{Fore.GREEN}✓ Connected to UniFi Protect")
+        print(f"{_OK}Connected to UniFi Protect")
+        self._schedule_keepalive()
         
         # Create controllers for enabled cameras
-        enabled_cameras = [cam for cam in self.config['cameras'] if cam.get('enabled', True)]
+        enabled_cameras = self.config.get('_enabled_cameras')
+        if enabled_cameras is None:
+            enabled_cameras = [cam for cam in self.config['cameras'] if cam.get('enabled', True)]
         
         for camera_config in enabled_cameras:
             try:
                 # Verify camera exists
                 camera = self.manager.get_camera_by_name(camera_config['name'])
                 if not camera:
-                    print(f"{Fore.YELLOW}⚠ Camera '{camera_config['name']}' not found, skipping")
+                    print(f"{_WARN}Camera '{camera_config['name']}' not found, skipping")
                     continue
                 
                 # Create controller
@@ -457,8 +670,9 @@ class MultiCameraPrivacyController:
                     timeout_minutes=camera_config.get('timeout_minutes', 60)
                 )
                 
-                # Share the UniFi manager
+                # Share the UniFi manager and the camera we just resolved
                 controller.manager = self.manager
+                controller.camera = camera
                 
                 # Set custom debounce time if specified
                 if 'debounce_time' in self.global_settings:
@@ -470,119 +684,168 @@ class MultiCameraPrivacyController:
                     controller.state_file = base_path.parent / f"privacy_state_{camera_config['name']}.json"
                 
                 self.controllers.append(controller)
-                print(f"{Fore.GREEN}✓ Added controller for '{camera_config['name']}' on GPIO {camera_config['gpio_pin']}")
+                print(f"{_OK}Added controller for '{camera_config['name']}' on GPIO {camera_config['gpio_pin']}")
                 
             except Exception as e:
-                print(f"{Fore.RED}✗ Failed to setup controller for '{camera_config['name']}': {e}")
+                print(f"{_ERR}Failed to setup controller for '{camera_config['name']}': {e}")
         
         if not self.controllers:
-            print(f"{Fore.RED}✗ No valid camera controllers created")
+            print(f"{_ERR}No valid camera controllers created")
             return False
         
-        # Set up GPIO for all controllers
+        # Set up GPIO for all controllers - reset global GPIO state once first
         print(f"\n{Fore.CYAN}Setting up GPIO for {len(self.controllers)} cameras...")
+        GPIO.setwarnings(False)
+        GPIO.cleanup()
         for controller in self.controllers:
             controller.setup_gpio()
             controller.load_state()
             controller.update_led()
+            controller.schedule_timeout()
         
         return True
     
-    async def run(self):
-        """Run the multi-camera controller."""
-        if not await self.setup():
-            return False
+    async def _setup_unless_stopped(self) -> bool:
+        """Run setup(), abandoning it if stop() is called first.
+        
+        Connecting to UniFi Protect can take a while, and a shutdown signal
+        shouldn't have to wait for it.
+        """
+        setup_task = asyncio.ensure_future(self.setup())
+        stop_task = asyncio.ensure_future(self._stop_event.wait())
+        await asyncio.wait((setup_task, stop_task), return_when=asyncio.FIRST_COMPLETED)
+        stop_task.cancel()
         
-        startup_delay = self.global_settings.get('startup_delay', 5)
-        print(f"{Fore.CYAN}Waiting {startup_delay}s for system startup...")
-        await asyncio.sleep(startup_delay)
+        if setup_task.done():
+            return setup_task.result()
         
-        print(f"\n{Fore.GREEN}🚀 Multi-Camera Privacy Controller is running!")
-        print(f"{Fore.CYAN}Managing {len(self.controllers)} cameras:")
-        for controller in self.controllers:
-            status = "ENABLED" if controller.privacy_enabled else "DISABLED"
-            print(f"  - {controller.camera_name}: GPIO {controller.button_pin} (Privacy: {status})")
-        print(f"{Fore.CYAN}Press Ctrl+C to stop")
+        setup_task.cancel()
+        await asyncio.gather(setup_task, return_exceptions=True)
+        return False
+    
+    async def run(self):
+        """Run the multi-camera controller."""
+        # Let coroutines that finish without blocking skip a loop round trip
+        # (Python 3.12+)
+        if hasattr(asyncio, 'eager_task_factory'):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
         
+        # Everything from here on is cleaned up in the finally block,
+        # including a setup that was abandoned or failed part way
         try:
-            polling_interval = self.global_settings.get('polling_interval', 0.1)
+            if not await self._setup_unless_stopped():
+                # Stopping during setup is a clean shutdown, a failed setup isn't
+                return not self.running
             
-            # Initialize button state tracking for each controller
-            button_states = {}
-            button_press_times = {}
+            for controller in self.controllers:
+                controller.start_tasks()
             
+            startup_delay = self.global_settings.get('startup_delay', 5)
+            print(f"{Fore.CYAN}Waiting {startup_delay}s for system startup...")
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), startup_delay)
+            except asyncio.TimeoutError:
+                pass
+            if not self.running:
+                return True
+            
+            print(f"\n{Fore.GREEN}🚀 Multi-Camera Privacy Controller is running!")
+            print(f"{Fore.CYAN}Managing {len(self.controllers)} cameras:")
             for controller in self.controllers:
-                button_states[controller.camera_name] = GPIO.input(controller.button_pin)
-                button_press_times[controller.camera_name] = 0
+                status = "ENABLED" if controller.privacy_enabled else "DISABLED"
+                print(f"  - {controller.camera_name}: GPIO {controller.button_pin} (Privacy: {status})")
+            print(f"{Fore.CYAN}Press Ctrl+C to stop")
             
-            while self.running:
-                # Check timeouts for all controllers
-                timeout_tasks = [controller.check_timeout() for controller in self.controllers]
-                await asyncio.gather(*timeout_tasks, return_exceptions=True)
-                
-                # Poll button states for all controllers (backup for failed interrupts)
-                for controller in self.controllers:
-                    try:
-                        current_button_state = GPIO.input(controller.button_pin)
-                        last_button_state = button_states[controller.camera_name]
-                        
-                        # Detect button press (HIGH to LOW transition)
-                        if last_button_state == GPIO.HIGH and current_button_state == GPIO.LOW:
-                            current_time = time.time()
-                            if current_time - button_press_times[controller.camera_name] > 0.5:  # 500ms debounce
-                                button_press_times[controller.camera_name] = current_time
-                                print(f"{Fore.MAGENTA}🔘 Button detected via polling for {controller.camera_name}")
-                                await controller.handle_button_press()
-                        
-                        button_states[controller.camera_name] = current_button_state
-                        
-                    except Exception as e:
-                        print(f"{Fore.RED}✗ Button polling error for {controller.camera_name}: {e}")
-                
-                await asyncio.sleep(polling_interval)
-                
+            polling_interval = self.global_settings.get('polling_interval', 0.1)
+            
+            # Only buttons without a working interrupt need to be polled
+            polled_controllers = [c for c in self.controllers if not c.interrupt_enabled]
+            if not polled_controllers:
+                # Presses and timeouts are all event driven - wait for shutdown
+                await self._stop_event.wait()
+                return True
+            
+            print(f"{_WARN}Polling {len(polled_controllers)} button(s) without interrupt support")
+            
+            await poll_buttons(polled_controllers, polling_interval, self._stop_event)
+        
         except KeyboardInterrupt:
             print(f"\n{Fore.YELLOW}Received stop signal")
         
         finally:
             self.cleanup()
+            if self.manager:
+                await self.manager.disconnect()
         
         return True
     
+    def _schedule_keepalive(self):
+        """Arm the next UniFi Protect keepalive ping."""
+        interval = self.global_settings.get('keepalive_interval', KEEPALIVE_INTERVAL)
+        if interval > 0:
+            loop = asyncio.get_running_loop()
+            self._keepalive_handle = loop.call_later(interval, self._keepalive_cb)
+    
+    def _keepalive_cb(self):
+        """Timer callback - run the keepalive ping on the event loop."""
+        self._keepalive_task = asyncio.create_task(self._keepalive())
+    
+    async def _keepalive(self):
+        """Ping UniFi Protect, then re-arm the timer."""
+        if not await self.manager.ping():
+            logger.warning("UniFi Protect keepalive ping failed")
+        self._schedule_keepalive()
+    
+    def stop(self):
+        """Ask the main loop to exit."""
+        self.running = False
+        self._stop_event.set()
+    
     def cleanup(self):
         """Clean up all controllers."""
         print(f"\n{Fore.CYAN}Cleaning up multi-camera controller...")
         
+        if self._keepalive_handle:
+            self._keepalive_handle.cancel()
+            self._keepalive_handle = None
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        
         for controller in self.controllers:
             try:
                 controller.cleanup()
             except Exception as e:
-                print(f"{Fore.YELLOW}⚠ Cleanup error for {controller.camera_name}: {e}")
+                print(f"{_WARN}Cleanup error for {controller.camera_name}: {e}")
         
-        print(f"{Fore.GREEN}✓ Multi-camera cleanup complete")
-
-
-def signal_handler(signum, frame):
-    """Handle shutdown signals."""
-    print(f"\n{Fore.YELLOW}Received signal {signum}, shutting down...")
-    sys.exit(0)
+        print(f"{_OK}Multi-camera cleanup complete")
 
 
 async def main():
     """Main function."""
-    # Clean up any existing GPIO state first
-    GPIO.setwarnings(False)
-    GPIO.cleanup()
-    
-    # Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Load .env first so LOG_LEVEL can be set there as well
+    load_config()
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+        format='%(levelname)s %(message)s'
+    )
     
     # Load camera configuration
     config = load_cameras_config()
     
     # Create and run multi-camera controller
     controller = MultiCameraPrivacyController(config)
+    
+    # Shut down through the controller so its run loop exits and cleans up
+    # GPIO, pending state and the UniFi Protect session
+    def on_signal(signum):
+        print(f"\n{Fore.YELLOW}Received signal {signum}, shutting down...")
+        controller.stop()
+    
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, on_signal, signum)
+    
     success = await controller.run()
     
     sys.exit(0 if success else 1)
@@ -6,60 +6,33 @@ This script helps you test your connection to UniFi Protect before using the mai
 """
 
 import asyncio
-import os
 import sys
 from pathlib import Path
 
 from colorama import init, Fore, Style
-from dotenv import load_dotenv
 
-try:
-    from uiprotect import ProtectApiClient
-except ImportError:
-    print(f"{Fore.RED}Error: uiprotect library not found. Please install dependencies with:")
-    print(f"pip install -r requirements.txt")
-    sys.exit(1)
+# Share the configuration handling with the main application
+from ufp_config import load_config, validate_config
 
 # Initialize colorama
 init(autoreset=True)
 
 
-def load_config():
-    """Load configuration from environment variables."""
-    # Try to load from .env file first
-    env_file = Path('.env')
-    if env_file.exists():
-        load_dotenv(env_file)
-        print(f"{Fore.GREEN}✓ Found .env file")
-    else:
-        print(f"{Fore.YELLOW}⚠ No .env file found, using environment variables")
-    
-    config = {
-        'host': os.getenv('UFP_HOST', ''),
-        'port': int(os.getenv('UFP_PORT', '443')),
-        'username': os.getenv('UFP_USERNAME', ''),
-        'password': os.getenv('UFP_PASSWORD', ''),
-        'verify_ssl': os.getenv('UFP_SSL_VERIFY', 'True').lower() == 'true'
-    }
-    
-    return config
-
-
 async def test_connection():
     """Test connection to UniFi Protect."""
     print(f"{Fore.CYAN}{Style.BRIGHT}UniFi Protect Connection Test")
     print("=" * 35)
     
     # Load configuration
+    if Path('.env').exists():
+        print(f"{Fore.GREEN}✓ Found .env file")
+    else:
+        print(f"{Fore.YELLOW}⚠ No .env file found, using environment variables")
+    
     config = load_config()
     
     # Check required configuration
-    missing = []
-    required_fields = ['host', 'username', 'password']
-    
-    for field in required_fields:
-        if not config.get(field):
-            missing.append(field.upper())
+    missing = validate_config(config)
     
     if missing:
         print(f"{Fore.RED}✗ Missing required configuration:")
@@ -80,6 +53,14 @@ async def test_connection():
     # Test connection
     print(f"\n{Fore.CYAN}Testing connection...")
     
+    # Only pull in the API client once the configuration checks have passed
+    try:
+        from uiprotect import ProtectApiClient
+    except ImportError:
+        print(f"{Fore.RED}Error: uiprotect library not found. Please install dependencies with:")
+        print(f"pip install -r requirements.txt")
+        return False
+    
     try:
         client = ProtectApiClient(
             host=config['host'],
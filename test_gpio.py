@@ -5,19 +5,107 @@ Simple GPIO button test script
 This tests if the button hardware and GPIO setup is working correctly.
 """
 
-import time
+import asyncio
 import sys
+import time
 
 try:
-    import RPi.GPIO as GPIO
+    import gpiod
+    from gpiod.line import Bias, Direction, Edge, Value
 except ImportError:
-    print("ERROR: RPi.GPIO not installed!")
-    print("Install with: pip install RPi.GPIO")
+    print("ERROR: gpiod (libgpiod v2 bindings) not installed!")
+    print("Install with: pip install 'gpiod>=2'")
     sys.exit(1)
 
+try:
+    import pigpio
+except ImportError:
+    pigpio = None  # Hardware-timed LED test is optional
+
 # Configuration
+GPIO_CHIP = '/dev/gpiochip0'
 BUTTON_PIN = 18
 LED_PIN = 24
+BOUNCE_TIME_MS = 20
+CONSUMER = 'test_gpio'
+BLINK_COUNT = 3
+BLINK_US = 500000
+
+def blink_led_waveform():
+    """Blink the LED with a hardware-timed pigpio waveform.
+    
+    Returns False when pigpio or the pigpiod daemon is not available.
+    """
+    if pigpio is None:
+        return False
+    
+    pi = pigpio.pi()
+    if not pi.connected:
+        return False
+    
+    try:
+        mask = 1 << LED_PIN
+        pi.set_mode(LED_PIN, pigpio.OUTPUT)
+        pi.wave_clear()
+        pi.wave_add_generic([pigpio.pulse(mask, 0, BLINK_US), pigpio.pulse(0, mask, BLINK_US)] * BLINK_COUNT)
+        wave_id = pi.wave_create()
+        
+        print(f"  Blinking LED {BLINK_COUNT} times (hardware timed via pigpio)")
+        pi.wave_send_once(wave_id)
+        while pi.wave_tx_busy():
+            time.sleep(0.1)
+        
+        pi.wave_delete(wave_id)
+        return True
+    finally:
+        pi.stop()
+
+async def blink_led(request):
+    """Blink the LED from Python, timed by the event loop."""
+    for i in range(BLINK_COUNT):
+        request.set_value(LED_PIN, Value.ACTIVE)
+        print("  LED ON")
+        await asyncio.sleep(BLINK_US / 1e6)
+        request.set_value(LED_PIN, Value.INACTIVE)
+        print("  LED OFF")
+        await asyncio.sleep(BLINK_US / 1e6)
+
+async def watch_button(request, button_pressed):
+    """Report button presses until interrupted."""
+    loop = asyncio.get_running_loop()
+    confirm_handle = None
+    
+    def confirm_press():
+        nonlocal confirm_handle
+        confirm_handle = None
+        
+        # Still LOW once the contact stopped bouncing - a real press
+        if request.get_value(BUTTON_PIN) != Value.INACTIVE:
+            return
+        
+        print("🔘 BUTTON PRESSED!")
+        button_pressed.set()
+        
+        # Flash LED on button press
+        request.set_value(LED_PIN, Value.ACTIVE)
+        loop.call_later(0.1, request.set_value, LED_PIN, Value.INACTIVE)
+    
+    def on_edge():
+        nonlocal confirm_handle
+        for event in request.read_edge_events():
+            if event.event_type == gpiod.EdgeEvent.Type.FALLING_EDGE and confirm_handle is None:
+                confirm_handle = loop.call_later(BOUNCE_TIME_MS / 1000, confirm_press)
+    
+    # Edge events arrive on the request's file descriptor, which the event
+    # loop watches with epoll - nothing is polled while waiting
+    fd = request.fd
+    loop.add_reader(fd, on_edge)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        loop.remove_reader(fd)
+        if confirm_handle:
+            confirm_handle.cancel()
 
 def test_gpio():
     """Test GPIO functionality."""
@@ -26,23 +114,27 @@ def test_gpio():
     print(f"LED Pin: GPIO {LED_PIN}")
     print()
     
+    request = None
+    button_pressed = asyncio.Event()
+    
     try:
         # Setup GPIO
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setup(BUTTON_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-        GPIO.setup(LED_PIN, GPIO.OUT)
+        request = gpiod.request_lines(
+            GPIO_CHIP,
+            consumer=CONSUMER,
+            config={
+                LED_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.INACTIVE),
+                # Button to GND with the internal pull-up: pressing it pulls the line LOW
+                BUTTON_PIN: gpiod.LineSettings(edge_detection=Edge.BOTH, bias=Bias.PULL_UP),
+            },
+        )
         
         print("✓ GPIO setup successful")
         
         # Test LED
         print("Testing LED...")
-        for i in range(3):
-            GPIO.output(LED_PIN, GPIO.HIGH)
-            print("  LED ON")
-            time.sleep(0.5)
-            GPIO.output(LED_PIN, GPIO.LOW)
-            print("  LED OFF")
-            time.sleep(0.5)
+        if not blink_led_waveform():
+            asyncio.run(blink_led(request))
         
         print("\n✓ LED test complete")
         
@@ -50,28 +142,11 @@ def test_gpio():
         print(f"\nTesting button on GPIO {BUTTON_PIN}...")
         print("Press the button (Ctrl+C to exit)")
         
-        button_pressed = False
-        last_state = GPIO.input(BUTTON_PIN)
-        
-        while True:
-            current_state = GPIO.input(BUTTON_PIN)
-            
-            # Button pressed (goes from HIGH to LOW with pull-up)
-            if last_state == GPIO.HIGH and current_state == GPIO.LOW:
-                print("🔘 BUTTON PRESSED!")
-                button_pressed = True
-                
-                # Flash LED on button press
-                GPIO.output(LED_PIN, GPIO.HIGH)
-                time.sleep(0.1)
-                GPIO.output(LED_PIN, GPIO.LOW)
-            
-            last_state = current_state
-            time.sleep(0.01)  # Small delay
-        
+        asyncio.run(watch_button(request, button_pressed))
+    
     except KeyboardInterrupt:
         print(f"\n\nTest interrupted")
-        if button_pressed:
+        if button_pressed.is_set():
             print("✓ Button is working correctly!")
         else:
             print("✗ Button was not detected")
@@ -81,17 +156,19 @@ def test_gpio():
             print("   - Other side to GND (Physical pin 14)")
             print("2. Ensure button is 'normally open' type")
             print("3. Check connections are secure")
-        
+    
     except Exception as e:
         print(f"❌ GPIO Error: {e}")
         print("\nPossible causes:")
         print("1. Permission issue - try: sudo usermod -a -G gpio $USER")
         print("2. Need to reboot after adding to gpio group")
         print("3. Hardware not connected properly")
-        
+    
     finally:
-        GPIO.cleanup()
+        if request:
+            request.set_value(LED_PIN, Value.INACTIVE)
+            request.release()
         print("🧹 GPIO cleanup complete")
 
 if __name__ == "__main__":
-    test_gpio() 
\ No newline at end of file
+    test_gpio()
@@ -0,0 +1,52 @@
+"""
+UniFi Protect connection settings
+
+Loads the UFP_* settings from the environment or a .env file. Kept apart
+from unifi_camera_privacy so that tools which only need the settings don't
+import the UniFi Protect client.
+"""
+
+import functools
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, List, Mapping
+
+from dotenv import load_dotenv
+
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> Mapping[str, Any]:
+    """Load configuration from environment variables.
+    
+    The result is cached for the life of the process and returned as a
+    read-only mapping, since every caller shares the same object.
+    """
+    # Try to load from .env file first, unless the environment already
+    # provides the settings (Docker, systemd, CI)
+    if not os.getenv('UFP_HOST'):
+        env_file = Path('.env')
+        if env_file.exists():
+            load_dotenv(env_file)
+    
+    config = {
+        'host': os.getenv('UFP_HOST', ''),
+        'port': int(os.getenv('UFP_PORT', '443')),
+        'username': os.getenv('UFP_USERNAME', ''),
+        'password': os.getenv('UFP_PASSWORD', ''),
+        'verify_ssl': os.getenv('UFP_SSL_VERIFY', 'True').lower() == 'true'
+    }
+    
+    return MappingProxyType(config)
+
+
+def validate_config(config: Mapping) -> List[str]:
+    """Validate the configuration and return list of missing parameters."""
+    missing = []
+    required_fields = ['host', 'username', 'password']
+    
+    for field in required_fields:
+        if not config.get(field):
+            missing.append(field.upper())
+    
+    return missing
@@ -7,21 +7,103 @@ It provides both CLI and interactive modes for managing camera privacy settings.
 """
 
 import asyncio
+import hashlib
+import json
 import os
 import sys
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+import aiohttp
 import click
 from colorama import init, Fore, Style
-from dotenv import load_dotenv
 from uiprotect import ProtectApiClient
-from uiprotect.data import Camera
+from uiprotect.data import Bootstrap, Camera
+
+from ufp_config import load_config, validate_config
+
+try:
+    from uiprotect.data.types import IRLEDMode
+except ImportError:
+    # Older uiprotect versions - IR LED control is reported as unavailable
+    IRLEDMode = None
 
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
+# Coloured status labels for the camera lists
+_PRIVACY_ON = f"{Fore.RED}[PRIVACY ON]"
+_PRIVACY_OFF = f"{Fore.GREEN}[PRIVACY OFF]"
+_PRIVACY_STATUS = (_PRIVACY_OFF, _PRIVACY_ON)  # indexed by has-privacy-zone
+_LED_STATUS = {
+    "ON": f"{Fore.GREEN}[LED ON]",
+    "OFF": f"{Fore.RED}[LED OFF]",
+    "UNKNOWN": f"{Fore.YELLOW}[LED UNKNOWN]",
+}
+
+# Bootstrap data is cached on disk for this long (seconds) so that short-lived
+# status commands can skip the full bootstrap fetch
+BOOTSTRAP_CACHE_TTL = 60
+BOOTSTRAP_CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'unifi_camera_privacy'
+
+# HTTP connection pool for the UniFi Protect API - a toggle makes a handful
+# of requests to the same host, which should share one TLS connection
+HTTP_CONNECTIONS_PER_HOST = 4
+HTTP_KEEPALIVE_TIMEOUT = 30  # seconds
+
+# Camera settings that may control / report the status LED, in probe order
+_LED_SETTING_NAMES = ('status_light', 'led_enabled', 'indicator_light')
+
+# LED control strategy that worked for each camera model, discovered on
+# first use: 'set_status_light', 'set_led_mode' or 'update_device:<setting>'
+_LED_STRATEGY_CACHE: Dict[str, str] = {}
+
+# LED status attributes present on each camera model
+_LED_STATUS_PROP_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+# How to switch the LED for each strategy - called with (camera, enabled)
+_LED_ACTIONS = {
+    'set_status_light': lambda camera, enabled: camera.set_status_light(enabled),
+    'set_led_mode': lambda camera, enabled: camera.set_led_mode('normal' if enabled else 'blink'),
+    **{
+        f'update_device:{name}': (lambda camera, enabled, name=name: camera.update_device({name: enabled}))
+        for name in _LED_SETTING_NAMES
+    },
+}
+
+
+def _camera_model_key(camera: Camera) -> str:
+    """Key for per-model capability caches."""
+    return str(getattr(camera, 'type', None) or type(camera).__name__)
+
+
+def _static_led_strategy(camera: Camera) -> Optional[str]:
+    """Pick an LED strategy from the camera's API and feature flags alone.
+    
+    Returns None when only trying the camera settings can tell.
+    """
+    if hasattr(camera, 'set_status_light'):
+        return 'set_status_light'
+    
+    flags = getattr(camera, 'feature_flags', None)
+    if getattr(flags, 'has_led_status', False) and hasattr(camera, 'update_device'):
+        return 'update_device:status_light'
+    
+    return None
+
+
+@dataclass
+class CameraSnapshot:
+    """Display state of all cameras, as parallel lists in camera order."""
+    ids: List[str]
+    names: List[str]
+    has_zone: List[bool]
+    led_status: List[str]
+
 
 class UniFiProtectManager:
     """Main class for managing UniFi Protect camera privacy zones."""
@@ -34,22 +116,48 @@ class UniFiProtectManager:
         self.password = password
         self.verify_ssl = verify_ssl
         self.client: Optional[ProtectApiClient] = None
+        self._session: Optional[aiohttp.ClientSession] = None
         self.cameras: Dict[str, Camera] = {}
+        self._by_name_cf: Dict[str, Camera] = {}
     
-    async def connect(self) -> bool:
-        """Connect to UniFi Protect and initialize the client."""
+    async def connect(self, use_cache: bool = False) -> bool:
+        """Connect to UniFi Protect and initialize the client.
+        
+        With use_cache, recently cached bootstrap data is used instead of
+        fetching it again - only suitable for read-only commands.
+        """
         try:
+            # Our own session keeps connections alive between the requests of
+            # one command; uiprotect leaves closing it to us
+            await self._close_session()
+            self._session = aiohttp.ClientSession(
+                # Like uiprotect's own session: the auth token is an httponly
+                # cookie, and the default jar drops cookies from IP hosts
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=HTTP_CONNECTIONS_PER_HOST,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                    ssl=self.verify_ssl
+                )
+            )
+            
             self.client = ProtectApiClient(
                 host=self.host,
                 port=self.port,
                 username=self.username,
                 password=self.password,
-                verify_ssl=self.verify_ssl
+                verify_ssl=self.verify_ssl,
+                session=self._session
             )
             
             # Initialize the client and get bootstrap data
-            await self.client.update()
-            self.cameras = self.client.bootstrap.cameras
+            if not (use_cache and self._load_cached_bootstrap()):
+                await self.client.update()
+                # Only read-only commands use the cache - don't write the
+                # bootstrap (credentials included) to disk for anything else
+                if use_cache:
+                    self._save_cached_bootstrap()
+            self._use_bootstrap()
             
             print(f"{Fore.GREEN}✓ Successfully connected to UniFi Protect at {self.host}")
             print(f"{Fore.CYAN}Found {len(self.cameras)} camera(s)")
@@ -58,51 +166,163 @@ class UniFiProtectManager:
             
         except Exception as e:
             print(f"{Fore.RED}✗ Failed to connect to UniFi Protect: {e}")
+            await self._close_session()
+            return False
+    
+    def subscribe_updates(self) -> Callable[[], None]:
+        """Keep the bootstrap data current from the Protect websocket.
+        
+        uiprotect applies the updates to the camera objects itself, so the
+        callback has nothing to do. Returns the unsubscribe function.
+        """
+        return self.client.subscribe_websocket(lambda message: None)
+    
+    def _use_bootstrap(self):
+        """Index the cameras of the client's current bootstrap data."""
+        self.cameras = self.client.bootstrap.cameras
+        self._build_name_index()
+        self._prime_led_strategies()
+    
+    async def ping(self) -> bool:
+        """Make a lightweight API call to keep the connection to UniFi Protect warm."""
+        if not self.client:
+            return False
+        
+        try:
+            await self.client.get_nvr()
+            return True
+        except Exception:
+            return False
+    
+    def _bootstrap_cache_file(self) -> Path:
+        """Bootstrap cache file for this host and user."""
+        key = hashlib.sha256(f"{self.host}:{self.username}".encode()).hexdigest()
+        return BOOTSTRAP_CACHE_DIR / f"{key}.json"
+    
+    def _load_cached_bootstrap(self) -> bool:
+        """Restore bootstrap data from the disk cache if it is still fresh."""
+        cache_file = self._bootstrap_cache_file()
+        try:
+            if time.time() - cache_file.stat().st_mtime > BOOTSTRAP_CACHE_TTL:
+                return False
+            data = json.loads(cache_file.read_bytes())
+            self.client._bootstrap = Bootstrap.from_unifi_dict(**data, api=self.client)
+            return True
+        except Exception:
+            # Missing, stale or unreadable cache - fetch from the NVR instead
             return False
     
+    def _save_cached_bootstrap(self):
+        """Write the current bootstrap data to the disk cache (best effort)."""
+        cache_file = self._bootstrap_cache_file()
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            BOOTSTRAP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            data = json.dumps(self.client.bootstrap.unifi_dict(), default=str)
+            # Camera data is private - keep the cache readable by this user only
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(tmp_file, cache_file)
+        except Exception:
+            pass
+    
+    def invalidate_bootstrap_cache(self):
+        """Drop the cached bootstrap data - call once per command that changes camera settings."""
+        try:
+            self._bootstrap_cache_file().unlink()
+        except OSError:
+            pass
+    
+    async def _close_session(self):
+        """Close the HTTP session, if one is open."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+    
     async def disconnect(self):
         """Disconnect from UniFi Protect."""
         if self.client:
-            # The client doesn't have an explicit disconnect method in the current version
-            # but the websocket connection will be closed when the object is destroyed
-            pass
+            try:
+                await self.client.async_disconnect_ws()
+            except Exception:
+                pass  # Never connected, or already closed
+        await self._close_session()
     
     def list_cameras(self) -> List[Tuple[str, str, bool]]:
         """Get a list of all cameras with their privacy zone status."""
-        camera_list = []
-        for camera_id, camera in self.cameras.items():
-            # Check if camera has any privacy zones
-            has_privacy_zone = len(camera.privacy_zones) > 0
-            camera_list.append((camera_id, camera.name, has_privacy_zone))
-        
-        return camera_list
+        return [
+            (camera_id, camera.name, bool(camera.privacy_zones))
+            for camera_id, camera in self.cameras.items()
+        ]
     
-    def get_camera_by_name(self, name: str) -> Optional[Camera]:
-        """Get a camera by its name."""
+    async def snapshot(self) -> CameraSnapshot:
+        """Capture the id, name, privacy zone and LED status of every camera."""
+        cameras = list(self.cameras.items())
+        # Fetch all LED statuses concurrently rather than one at a time
+        led_status = await asyncio.gather(*(self.get_led_status(camera) for _, camera in cameras))
+        return CameraSnapshot(
+            ids=[camera_id for camera_id, _ in cameras],
+            names=[camera.name for _, camera in cameras],
+            has_zone=[bool(camera.privacy_zones) for _, camera in cameras],
+            led_status=list(led_status),
+        )
+    
+    def _build_name_index(self):
+        """Index cameras by case-folded name for get_camera_by_name."""
+        self._by_name_cf = {}
         for camera in self.cameras.values():
-            if camera.name.lower() == name.lower():
-                return camera
-        return None
+            # First camera wins if two share a name, as with a linear scan
+            self._by_name_cf.setdefault(camera.name.casefold(), camera)
+    
+    def _prime_led_strategies(self):
+        """Cache LED strategies that the camera API and feature flags already decide."""
+        for camera in self.cameras.values():
+            model_key = _camera_model_key(camera)
+            if model_key not in _LED_STRATEGY_CACHE:
+                strategy = _static_led_strategy(camera)
+                if strategy:
+                    _LED_STRATEGY_CACHE[model_key] = strategy
+    
+    def get_camera_by_name(self, name: str) -> Optional[Camera]:
+        """Get a camera by its name (case-insensitive)."""
+        return self._by_name_cf.get(name.casefold())
     
     def get_camera_by_id(self, camera_id: str) -> Optional[Camera]:
         """Get a camera by its ID."""
         return self.cameras.get(camera_id)
     
+    @staticmethod
+    async def _update_concurrently(*updates):
+        """Await independent camera updates together, raising one combined error."""
+        results = await asyncio.gather(*updates, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise RuntimeError("; ".join(str(error) for error in errors))
+    
     async def toggle_privacy_zone(self, camera: Camera) -> bool:
         """Toggle privacy zone for a camera."""
         try:
-            if len(camera.privacy_zones) > 0:
+            # Read the zones once - each access goes through the pydantic model
+            zones = list(camera.privacy_zones)
+            if zones:
                 # Camera has privacy zones - remove them (enable camera)
-                await self.remove_privacy_zones(camera)
-                await self.set_led_normal(camera)
-                await self.set_ir_led_auto(camera)
+                await self._update_concurrently(
+                    self.remove_privacy_zones(camera, zones=zones),
+                    self.set_led_normal(camera),
+                    self.set_ir_led_auto(camera)
+                )
                 print(f"{Fore.GREEN}✓ Privacy zone disabled for camera '{camera.name}'")
                 return True
             else:
-                # Camera has no privacy zones - add one (disable camera)
+                # Camera has no privacy zones - add one (disable camera).
+                # The zone goes first so the LEDs only go dark once the
+                # camera is actually blocked.
                 await self.add_privacy_zone(camera)
-                await self.set_led_privacy_mode(camera)
-                await self.set_ir_led_off(camera)
+                await self._update_concurrently(
+                    self.set_led_privacy_mode(camera),
+                    self.set_ir_led_off(camera)
+                )
                 print(f"{Fore.YELLOW}✓ Privacy zone enabled for camera '{camera.name}'")
                 return True
                 
@@ -129,11 +349,11 @@ class UniFiProtectManager:
             # Try using the set_privacy method instead
             await camera.set_privacy(True, 0)
     
-    async def remove_privacy_zones(self, camera: Camera):
-        """Remove all privacy zones from a camera."""
+    async def remove_privacy_zones(self, camera: Camera, zones: Optional[List[Any]] = None):
+        """Remove all privacy zones from a camera (or just the given zones)."""
         try:
             # Remove all existing privacy zones
-            for privacy_zone in camera.privacy_zones:
+            for privacy_zone in (camera.privacy_zones if zones is None else zones):
                 await privacy_zone.delete()
         except (AttributeError, TypeError):
             # Fallback for different uiprotect library versions
@@ -143,18 +363,24 @@ class UniFiProtectManager:
     async def set_privacy_mode(self, camera: Camera, enabled: bool) -> bool:
         """Set privacy mode for a camera (alternative method)."""
         try:
+            # The privacy switch goes first - the microphone fallback reads
+            # the privacy state back - then the rest run concurrently
             if enabled:
                 # Enable privacy mode (this typically disables recording and creates a privacy zone)
                 await camera.set_privacy(True, 0)  # 0 = mic level when in privacy mode (muted)
-                await self.set_led_privacy_mode(camera)
-                await self.set_ir_led_off(camera)
-                await self.set_microphone_off(camera)
+                await self._update_concurrently(
+                    self.set_led_privacy_mode(camera),
+                    self.set_ir_led_off(camera),
+                    self.set_microphone_off(camera)
+                )
             else:
                 # Disable privacy mode
                 await camera.set_privacy(False)
-                await self.set_led_normal(camera)
-                await self.set_ir_led_auto(camera)
-                await self.set_microphone_auto(camera)
+                await self._update_concurrently(
+                    self.set_led_normal(camera),
+                    self.set_ir_led_auto(camera),
+                    self.set_microphone_auto(camera)
+                )
             
             action = "enabled" if enabled else "disabled"
             print(f"{Fore.GREEN}✓ Privacy mode {action} for camera '{camera.name}'")
@@ -164,42 +390,66 @@ class UniFiProtectManager:
             print(f"{Fore.RED}✗ Failed to set privacy mode for camera '{camera.name}': {e}")
             return False
     
+    async def _probe_led_strategy(self, camera: Camera, enabled: bool) -> Optional[str]:
+        """Find a working way to switch the LED by trying each one in turn.
+        
+        Only used when _static_led_strategy can't decide. The winning
+        strategy has already been applied when this returns.
+        """
+        # LED settings via camera settings - different cameras may have
+        # different property names. Skipped if the camera says it has no
+        # status LED.
+        flags = getattr(camera, 'feature_flags', None)
+        if hasattr(camera, 'update_device') and getattr(flags, 'has_led_status', None) is not False:
+            for setting_name in _LED_SETTING_NAMES:
+                try:
+                    await camera.update_device({setting_name: enabled})
+                    return f'update_device:{setting_name}'
+                except:
+                    continue
+        
+        # LED mode (blink for privacy, normal otherwise)
+        if hasattr(camera, 'set_led_mode'):
+            try:
+                await camera.set_led_mode('normal' if enabled else 'blink')
+                return 'set_led_mode'
+            except:
+                pass
+        
+        return None
+    
+    async def _apply_led(self, camera: Camera, enabled: bool) -> Optional[str]:
+        """Switch the status LED, returning the strategy used (None if unsupported)."""
+        model_key = _camera_model_key(camera)
+        strategy = _LED_STRATEGY_CACHE.get(model_key)
+        
+        if strategy is None:
+            strategy = _static_led_strategy(camera)
+            if strategy is None:
+                # Not cached for unsupported models, so a transient failure
+                # during the first probe doesn't disable LED control for good
+                strategy = await self._probe_led_strategy(camera, enabled)
+                if strategy:
+                    _LED_STRATEGY_CACHE[model_key] = strategy
+                return strategy
+            _LED_STRATEGY_CACHE[model_key] = strategy
+        
+        await _LED_ACTIONS[strategy](camera, enabled)
+        return strategy
+    
     async def set_led_privacy_mode(self, camera: Camera):
         """Set LED to indicate privacy mode (blink or turn off)."""
         try:
-            # Method 1: Try to turn off the status light completely
-            if hasattr(camera, 'set_status_light'):
-                await camera.set_status_light(False)
-                print(f"{Fore.CYAN}  └─ LED turned OFF for privacy")
-                return
-            
-            # Method 2: Try setting LED settings via camera settings
-            if hasattr(camera, 'update_device'):
-                # Try updating LED settings - different cameras may have different property names
-                led_settings = {
-                    'status_light': False,  # Turn off status light
-                    'led_enabled': False,   # Alternative property name
-                    'indicator_light': False  # Another alternative
-                }
-                
-                for setting_name, value in led_settings.items():
-                    try:
-                        await camera.update_device({setting_name: value})
-                        print(f"{Fore.CYAN}  └─ LED turned OFF via {setting_name}")
-                        return
-                    except:
-                        continue
-            
-            # Method 3: Try blinking mode if available
-            if hasattr(camera, 'set_led_mode'):
-                try:
-                    await camera.set_led_mode('blink')  # or 'flash'
-                    print(f"{Fore.CYAN}  └─ LED set to BLINK for privacy")
-                    return
-                except:
-                    pass
+            strategy = await self._apply_led(camera, False)
             
-            print(f"{Fore.YELLOW}  └─ LED control not available for this camera model")
+            if strategy == 'set_status_light':
+                print(f"{Fore.CYAN}  └─ LED turned OFF for privacy")
+            elif strategy == 'set_led_mode':
+                print(f"{Fore.CYAN}  └─ LED set to BLINK for privacy")
+            elif strategy:
+                print(f"{Fore.CYAN}  └─ LED turned OFF via {strategy.split(':', 1)[1]}")
+            else:
+                print(f"{Fore.YELLOW}  └─ LED control not available for this camera model")
             
         except Exception as e:
             print(f"{Fore.YELLOW}  └─ LED control failed: {e}")
@@ -207,39 +457,16 @@ class UniFiProtectManager:
     async def set_led_normal(self, camera: Camera):
         """Set LED back to normal operation."""
         try:
-            # Method 1: Try to turn on the status light
-            if hasattr(camera, 'set_status_light'):
-                await camera.set_status_light(True)
-                print(f"{Fore.CYAN}  └─ LED restored to normal")
-                return
-            
-            # Method 2: Try setting LED settings via camera settings
-            if hasattr(camera, 'update_device'):
-                # Try updating LED settings
-                led_settings = {
-                    'status_light': True,   # Turn on status light
-                    'led_enabled': True,    # Alternative property name
-                    'indicator_light': True # Another alternative
-                }
-                
-                for setting_name, value in led_settings.items():
-                    try:
-                        await camera.update_device({setting_name: value})
-                        print(f"{Fore.CYAN}  └─ LED restored via {setting_name}")
-                        return
-                    except:
-                        continue
-            
-            # Method 3: Try normal/solid mode if available
-            if hasattr(camera, 'set_led_mode'):
-                try:
-                    await camera.set_led_mode('normal')  # or 'solid'
-                    print(f"{Fore.CYAN}  └─ LED set to normal mode")
-                    return
-                except:
-                    pass
+            strategy = await self._apply_led(camera, True)
             
-            print(f"{Fore.YELLOW}  └─ LED control not available for this camera model")
+            if strategy == 'set_status_light':
+                print(f"{Fore.CYAN}  └─ LED restored to normal")
+            elif strategy == 'set_led_mode':
+                print(f"{Fore.CYAN}  └─ LED set to normal mode")
+            elif strategy:
+                print(f"{Fore.CYAN}  └─ LED restored via {strategy.split(':', 1)[1]}")
+            else:
+                print(f"{Fore.YELLOW}  └─ LED control not available for this camera model")
             
         except Exception as e:
             print(f"{Fore.YELLOW}  └─ LED control failed: {e}")
@@ -247,9 +474,8 @@ class UniFiProtectManager:
     async def set_ir_led_off(self, camera: Camera):
         """Turn off IR LEDs for enhanced privacy."""
         try:
-            from uiprotect.data.types import IRLEDMode
-            
-            if hasattr(camera, 'set_ir_led_model') and camera.feature_flags.has_led_ir:
+            flags = camera.feature_flags
+            if IRLEDMode and hasattr(camera, 'set_ir_led_model') and flags.has_led_ir:
                 await camera.set_ir_led_model(IRLEDMode.OFF)
                 print(f"{Fore.CYAN}  └─ IR LEDs turned OFF for enhanced privacy")
                 return True
@@ -264,9 +490,8 @@ class UniFiProtectManager:
     async def set_ir_led_auto(self, camera: Camera):
         """Restore IR LEDs to automatic mode."""
         try:
-            from uiprotect.data.types import IRLEDMode
-            
-            if hasattr(camera, 'set_ir_led_model') and camera.feature_flags.has_led_ir:
+            flags = camera.feature_flags
+            if IRLEDMode and hasattr(camera, 'set_ir_led_model') and flags.has_led_ir:
                 await camera.set_ir_led_model(IRLEDMode.AUTO)
                 print(f"{Fore.CYAN}  └─ IR LEDs restored to AUTO mode")
                 return True
@@ -281,8 +506,9 @@ class UniFiProtectManager:
     async def get_ir_led_status(self, camera: Camera) -> str:
         """Get current IR LED status."""
         try:
-            if hasattr(camera, 'isp_settings') and camera.feature_flags.has_led_ir:
-                ir_mode = camera.isp_settings.ir_led_mode
+            isp_settings = getattr(camera, 'isp_settings', None)
+            if isp_settings is not None and camera.feature_flags.has_led_ir:
+                ir_mode = isp_settings.ir_led_mode
                 return str(ir_mode).upper()
             else:
                 return "NOT_AVAILABLE"
@@ -293,14 +519,17 @@ class UniFiProtectManager:
     async def get_led_status(self, camera: Camera) -> str:
         """Get current LED status."""
         try:
-            # Check various possible LED status properties
-            led_properties = ['status_light', 'led_enabled', 'indicator_light']
+            # Check the LED status properties this camera model has
+            model_key = _camera_model_key(camera)
+            led_properties = _LED_STATUS_PROP_CACHE.get(model_key)
+            if led_properties is None:
+                led_properties = tuple(prop for prop in _LED_SETTING_NAMES if hasattr(camera, prop))
+                _LED_STATUS_PROP_CACHE[model_key] = led_properties
             
             for prop in led_properties:
-                if hasattr(camera, prop):
-                    status = getattr(camera, prop)
-                    if status is not None:
-                        return "ON" if status else "OFF"
+                status = getattr(camera, prop)
+                if status is not None:
+                    return "ON" if status else "OFF"
             
             return "UNKNOWN"
             
@@ -393,10 +622,10 @@ class UniFiProtectManager:
             ]
             
             for prop, formatter in mic_properties:
-                if hasattr(camera, prop):
-                    value = getattr(camera, prop)
-                    if value is not None:
-                        return formatter(value)
+                # One attribute lookup per property instead of hasattr + getattr
+                value = getattr(camera, prop, None)
+                if value is not None:
+                    return formatter(value)
             
             return "UNKNOWN"
             
@@ -404,34 +633,137 @@ class UniFiProtectManager:
             return "UNKNOWN"
 
 
-def load_config() -> Dict[str, str]:
-    """Load configuration from environment variables."""
-    # Try to load from .env file first
-    env_file = Path('.env')
-    if env_file.exists():
-        load_dotenv(env_file)
-    
-    config = {
-        'host': os.getenv('UFP_HOST', ''),
-        'port': int(os.getenv('UFP_PORT', '443')),
-        'username': os.getenv('UFP_USERNAME', ''),
-        'password': os.getenv('UFP_PASSWORD', ''),
-        'verify_ssl': os.getenv('UFP_SSL_VERIFY', 'True').lower() == 'true'
-    }
-    
-    return config
+async def _show_led_status(manager: UniFiProtectManager, camera: Camera) -> bool:
+    """Print the status LED state of a camera."""
+    status = await manager.get_led_status(camera)
+    color = Fore.RED if status == "OFF" else Fore.GREEN if status == "ON" else Fore.YELLOW
+    print(f"{color}LED Status for '{camera.name}': {status}")
+    return True
+
+
+async def _show_ir_status(manager: UniFiProtectManager, camera: Camera) -> bool:
+    """Print the IR LED mode of a camera."""
+    status = await manager.get_ir_led_status(camera)
+    if status == "NOT_AVAILABLE":
+        color = Fore.YELLOW
+    elif status == "OFF":
+        color = Fore.RED
+    elif status in ["AUTO", "ON"]:
+        color = Fore.GREEN
+    else:
+        color = Fore.YELLOW
+    print(f"{color}IR LED Status for '{camera.name}': {status}")
+    return True
+
+
+async def _show_mic_status(manager: UniFiProtectManager, camera: Camera) -> bool:
+    """Print the microphone state of a camera."""
+    status = await manager.get_microphone_status(camera)
+    print(f"{Fore.CYAN}Microphone Status for '{camera.name}': {status}")
+    return True
+
+
+# Camera actions by CLI flag name - called with (manager, camera). When
+# several flags are given, the first one in this order wins.
+ACTION_HANDLERS = {
+    'led_off': lambda manager, camera: manager.set_led_privacy_mode(camera),
+    'led_on': lambda manager, camera: manager.set_led_normal(camera),
+    'led_status': _show_led_status,
+    'ir_off': lambda manager, camera: manager.set_ir_led_off(camera),
+    'ir_auto': lambda manager, camera: manager.set_ir_led_auto(camera),
+    'ir_status': _show_ir_status,
+    'mic_off': lambda manager, camera: manager.set_microphone_off(camera),
+    'mic_on': lambda manager, camera: manager.set_microphone_auto(camera),
+    'mic_status': _show_mic_status,
+    'enable_privacy': lambda manager, camera: manager.set_privacy_mode(camera, True),
+    'disable_privacy': lambda manager, camera: manager.set_privacy_mode(camera, False),
+    'toggle': lambda manager, camera: manager.toggle_privacy_zone(camera),
+}
+
+# Mutually exclusive actions, with the name used in the conflict error
+ACTION_CATEGORIES = (
+    (frozenset({'enable_privacy', 'disable_privacy'}), 'privacy'),
+    (frozenset({'led_off', 'led_on', 'led_status'}), 'LED'),
+    (frozenset({'ir_off', 'ir_auto', 'ir_status'}), 'IR LED'),
+    (frozenset({'mic_off', 'mic_on', 'mic_status'}), 'microphone'),
+)
+
+# Actions whose result is the command's success - the LED, IR and
+# microphone actions report problems but always succeed
+PRIVACY_ACTIONS = frozenset({'enable_privacy', 'disable_privacy', 'toggle'})
+
+# Actions that only read camera state
+READ_ONLY_ACTIONS = frozenset({'led_status', 'ir_status', 'mic_status'})
+
+
+async def run_action(manager: UniFiProtectManager, action: str, camera: Camera) -> bool:
+    """Run a named camera action, returning whether it succeeded."""
+    if action not in READ_ONLY_ACTIONS:
+        manager.invalidate_bootstrap_cache()
+    result = await ACTION_HANDLERS[action](manager, camera)
+    return result if action in PRIVACY_ACTIONS else True
 
 
-def validate_config(config: Dict) -> List[str]:
-    """Validate the configuration and return list of missing parameters."""
-    missing = []
-    required_fields = ['host', 'username', 'password']
+def _read_stdin_lines(loop: asyncio.AbstractEventLoop, lines: asyncio.Queue):
+    """Hand stdin lines to the event loop, then '' at EOF (runs in a thread)."""
+    for line in iter(sys.stdin.readline, ''):
+        try:
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+        except RuntimeError:
+            return  # Event loop already closed - shutting down
+    try:
+        loop.call_soon_threadsafe(lines.put_nowait, '')
+    except RuntimeError:
+        pass
+
+
+async def daemon_mode(manager: UniFiProtectManager) -> bool:
+    """Run camera actions read from stdin over one connection until EOF.
+    
+    Each line is a JSON object such as {"camera": "Front Door", "action": "enable_privacy"}.
+    The action is any ACTION_HANDLERS name and defaults to "toggle".
+    """
+    print(f"{Fore.CYAN}Daemon mode: reading commands from stdin (Ctrl+D to exit)")
+    sys.stdout.flush()
+    
+    # Follow changes made elsewhere (e.g. the Protect UI) over the websocket
+    # so toggles and status reports act on current camera state
+    unsubscribe = manager.subscribe_updates()
+    
+    # Read stdin on a daemon thread: unlike asyncio.to_thread's executor,
+    # it doesn't keep the process alive on Ctrl+C while blocked in readline
+    lines: asyncio.Queue = asyncio.Queue()
+    threading.Thread(
+        target=_read_stdin_lines, args=(asyncio.get_running_loop(), lines), daemon=True
+    ).start()
     
-    for field in required_fields:
-        if not config.get(field):
-            missing.append(field.upper())
+    while line := await lines.get():
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            command = json.loads(line)
+            camera_name = command['camera']
+            action = command.get('action', 'toggle')
+            if not isinstance(camera_name, str) or not isinstance(action, str):
+                raise TypeError("'camera' and 'action' must be strings")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"{Fore.RED}✗ Invalid command {line!r}: {e}")
+        else:
+            camera = manager.get_camera_by_name(camera_name) or manager.get_camera_by_id(camera_name)
+            if action not in ACTION_HANDLERS:
+                print(f"{Fore.RED}✗ Unknown action '{action}'")
+            elif not camera:
+                print(f"{Fore.RED}✗ Camera '{camera_name}' not found")
+            else:
+                await run_action(manager, action, camera)
+        
+        # Whoever is driving the daemon waits for each command's output
+        sys.stdout.flush()
     
-    return missing
+    unsubscribe()
+    return True
 
 
 async def interactive_mode():
@@ -465,23 +797,26 @@ async def interactive_mode():
     
     try:
         while True:
-            print(f"\n{Fore.CYAN}Available cameras:")
-            cameras = manager.list_cameras()
+            snap = await manager.snapshot()
             
-            if not cameras:
+            if not snap.ids:
+                print(f"\n{Fore.CYAN}Available cameras:")
                 print(f"{Fore.YELLOW}No cameras found.")
                 break
             
-            for i, (camera_id, name, has_privacy) in enumerate(cameras, 1):
-                camera_obj = manager.get_camera_by_id(camera_id)
-                privacy_status = f"{Fore.RED}[PRIVACY ON]" if has_privacy else f"{Fore.GREEN}[PRIVACY OFF]"
-                led_status = await manager.get_led_status(camera_obj) if camera_obj else "UNKNOWN"
-                led_color = Fore.RED if led_status == "OFF" else Fore.GREEN if led_status == "ON" else Fore.YELLOW
-                print(f"  {i}. {name} {privacy_status} {led_color}[LED {led_status}]")
+            # Build the whole screen and write it at once rather than line by
+            # line. Colorama only auto-resets at the end of a write, so each
+            # line resets its own colours.
+            lines = [f"\n{Fore.CYAN}Available cameras:{Style.RESET_ALL}"]
+            for i, (name, has_privacy, led_status) in enumerate(zip(snap.names, snap.has_zone, snap.led_status), 1):
+                lines.append(f"  {i}. {name} {_PRIVACY_STATUS[has_privacy]} {_LED_STATUS[led_status]}{Style.RESET_ALL}")
             
-            print(f"\n{Fore.CYAN}Options:")
-            print("  Enter camera number to toggle privacy zone")
-            print("  'q' to quit")
+            lines.append(f"\n{Fore.CYAN}Options:{Style.RESET_ALL}")
+            lines.append("  Enter camera number to toggle privacy zone")
+            lines.append("  'q' to quit")
+            
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
             
             choice = input(f"\n{Fore.WHITE}Your choice: ").strip()
             
@@ -490,10 +825,10 @@ async def interactive_mode():
             
             try:
                 camera_num = int(choice)
-                if 1 <= camera_num <= len(cameras):
-                    camera_id, camera_name, _ = cameras[camera_num - 1]
-                    camera = manager.get_camera_by_id(camera_id)
+                if 1 <= camera_num <= len(snap.ids):
+                    camera = manager.get_camera_by_id(snap.ids[camera_num - 1])
                     if camera:
+                        manager.invalidate_bootstrap_cache()
                         await manager.toggle_privacy_zone(camera)
                     else:
                         print(f"{Fore.RED}✗ Camera not found")
@@ -528,9 +863,10 @@ async def interactive_mode():
 @click.option('--mic-on', is_flag=True, help='Turn on microphone for specified camera')
 @click.option('--mic-status', is_flag=True, help='Show microphone status for specified camera')
 @click.option('--interactive', '-i', is_flag=True, help='Run in interactive mode')
+@click.option('--daemon', is_flag=True, help='Keep the connection open and run JSON commands read from stdin')
 def main(host, port, username, password, no_ssl_verify, camera, list_cameras, 
          enable_privacy, disable_privacy, led_off, led_on, led_status, 
-         ir_off, ir_auto, ir_status, mic_off, mic_on, mic_status, interactive):
+         ir_off, ir_auto, ir_status, mic_off, mic_on, mic_status, interactive, daemon):
     """UniFi Protect Camera Privacy Zone Manager
     
     Toggle privacy zones and control LED status lights, IR LEDs, and microphones for UniFi Protect cameras.
@@ -549,6 +885,7 @@ def main(host, port, username, password, no_ssl_verify, camera, list_cameras,
     - Independent IR LED control (off/auto/status)
     - Independent microphone control (off/on/status)
     - Perfect for automation and smart home integration
+    - Daemon mode runs many commands over a single connection
     """
     
     async def run_app():
@@ -565,7 +902,7 @@ def main(host, port, username, password, no_ssl_verify, camera, list_cameras,
         }
         
         # If interactive mode or no specific action, run interactive
-        if interactive or (not list_cameras and not camera):
+        if interactive or (not list_cameras and not camera and not daemon):
             return await interactive_mode()
         
         # Validate configuration
@@ -585,18 +922,31 @@ def main(host, port, username, password, no_ssl_verify, camera, list_cameras,
             verify_ssl=config['verify_ssl']
         )
         
-        if not await manager.connect():
+        # Requested actions in precedence order, toggling privacy by default
+        flags = {
+            'enable_privacy': enable_privacy, 'disable_privacy': disable_privacy,
+            'led_off': led_off, 'led_on': led_on, 'led_status': led_status,
+            'ir_off': ir_off, 'ir_auto': ir_auto, 'ir_status': ir_status,
+            'mic_off': mic_off, 'mic_on': mic_on, 'mic_status': mic_status,
+        }
+        active = [name for name in ACTION_HANDLERS if flags.get(name)] or ['toggle']
+        
+        # Read-only commands can use recently cached bootstrap data
+        status_only = READ_ONLY_ACTIONS.issuperset(active) and not daemon
+        if not await manager.connect(use_cache=bool(list_cameras or status_only)):
             return False
         
         try:
+            if daemon:
+                return await daemon_mode(manager)
+            
             if list_cameras:
                 # List all cameras
                 cameras = manager.list_cameras()
                 if cameras:
                     print(f"\n{Fore.CYAN}Available cameras:")
                     for camera_id, name, has_privacy in cameras:
-                        status = f"{Fore.RED}[PRIVACY ON]" if has_privacy else f"{Fore.GREEN}[PRIVACY OFF]"
-                        print(f"  {camera_id}: {name} {status}")
+                        print(f"  {camera_id}: {name} {_PRIVACY_STATUS[has_privacy]}")
                 else:
                     print(f"{Fore.YELLOW}No cameras found.")
                 
@@ -610,80 +960,12 @@ def main(host, port, username, password, no_ssl_verify, camera, list_cameras,
                     return False
                 
                 # Check for conflicting options
-                privacy_options = [enable_privacy, disable_privacy]
-                led_options = [led_off, led_on, led_status]
-                ir_options = [ir_off, ir_auto, ir_status]
-                mic_options = [mic_off, mic_on, mic_status]
+                for category, label in ACTION_CATEGORIES:
+                    if sum(1 for name in active if name in category) > 1:
+                        print(f"{Fore.RED}✗ Cannot specify multiple {label} options")
+                        return False
                 
-                if sum(privacy_options) > 1:
-                    print(f"{Fore.RED}✗ Cannot specify multiple privacy options")
-                    return False
-                
-                if sum(led_options) > 1:
-                    print(f"{Fore.RED}✗ Cannot specify multiple LED options")
-                    return False
-                
-                if sum(ir_options) > 1:
-                    print(f"{Fore.RED}✗ Cannot specify multiple IR LED options")
-                    return False
-                
-                if sum(mic_options) > 1:
-                    print(f"{Fore.RED}✗ Cannot specify multiple microphone options")
-                    return False
-                
-                # Handle LED control
-                if led_off:
-                    await manager.set_led_privacy_mode(cam_obj)
-                    return True
-                elif led_on:
-                    await manager.set_led_normal(cam_obj)
-                    return True
-                elif led_status:
-                    status = await manager.get_led_status(cam_obj)
-                    color = Fore.RED if status == "OFF" else Fore.GREEN if status == "ON" else Fore.YELLOW
-                    print(f"{color}LED Status for '{cam_obj.name}': {status}")
-                    return True
-                
-                # Handle IR LED control
-                if ir_off:
-                    await manager.set_ir_led_off(cam_obj)
-                    return True
-                elif ir_auto:
-                    await manager.set_ir_led_auto(cam_obj)
-                    return True
-                elif ir_status:
-                    status = await manager.get_ir_led_status(cam_obj)
-                    if status == "NOT_AVAILABLE":
-                        color = Fore.YELLOW
-                    elif status == "OFF":
-                        color = Fore.RED
-                    elif status in ["AUTO", "ON"]:
-                        color = Fore.GREEN
-                    else:
-                        color = Fore.YELLOW
-                    print(f"{color}IR LED Status for '{cam_obj.name}': {status}")
-                    return True
-                
-                # Handle microphone control
-                if mic_off:
-                    await manager.set_microphone_off(cam_obj)
-                    return True
-                elif mic_on:
-                    await manager.set_microphone_auto(cam_obj)
-                    return True
-                elif mic_status:
-                    status = await manager.get_microphone_status(cam_obj)
-                    print(f"{Fore.CYAN}Microphone Status for '{cam_obj.name}': {status}")
-                    return True
-                
-                # Handle privacy control
-                if enable_privacy:
-                    return await manager.set_privacy_mode(cam_obj, True)
-                elif disable_privacy:
-                    return await manager.set_privacy_mode(cam_obj, False)
-                else:
-                    # Toggle privacy zone
-                    return await manager.toggle_privacy_zone(cam_obj)
+                return await run_action(manager, active[0], cam_obj)
         
         finally:
             await manager.disconnect()